@@ -1,11 +1,32 @@
 """Module to hold utility methods dealing with types and classes."""
 
 
+from collections import deque
+from functools import lru_cache
+
+
+def iter_subclasses(cls):
+    """Lazily yields all the direct and indirect subclasses of the provided
+    class, so callers that short-circuit do not pay for the full walk.
+
+    """
+    # an iterative breadth-first walk avoids a Python frame per inheritance
+    # level and visits diamond-inheritance descendants only once
+    seen = set()
+    queue = deque(cls.__subclasses__())
+    while queue:
+        subclass = queue.popleft()
+        if subclass not in seen:
+            seen.add(subclass)
+            yield subclass
+            queue.extend(subclass.__subclasses__())
+
+
+@lru_cache(maxsize=None)
 def all_subclasses(cls):
-    """Recursively returns all the subclasses of the provided class.
+    """Returns all the direct and indirect subclasses of the provided class.
+    The result is memoized, so subclasses defined after the first call for a
+    given class will not be reflected.
 
     """
-    subclasses = cls.__subclasses__()
-    descendants = (descendant for subclass in subclasses
-                   for descendant in all_subclasses(subclass))
-    return set(subclasses) | set(descendants)
+    return frozenset(iter_subclasses(cls))
@@ -5,6 +5,7 @@ import codecs
 import errno
 import os
 import shutil
+import stat
 
 
 def makedirs(*args, **kwargs):
@@ -13,10 +14,20 @@ def makedirs(*args, **kwargs):
 
     """
     try:
-        os.makedirs(*args, **kwargs)
+        # fast path: when the parent directory already exists (the common
+        # case for the cache locations) one mkdir syscall does the job and
+        # skips makedirs' per-component existence checks
+        os.mkdir(*args, **kwargs)
     except OSError as ex:
-        if ex.errno != errno.EEXIST:
+        if ex.errno == errno.EEXIST:
+            return
+        if ex.errno != errno.ENOENT:
             raise
+        try:
+            os.makedirs(*args, **kwargs)
+        except OSError as ex:
+            if ex.errno != errno.EEXIST:
+                raise
 
 
 def remove(path):
@@ -24,13 +35,26 @@ def remove(path):
     whether the provided path is a file or directory.
 
     """
-    if not os.path.exists(path):
-        return
-
-    if os.path.isdir(path):
+    # a single stat answers both the existence and the file-vs-directory
+    # question that os.path.exists/isdir/isfile would each re-ask the
+    # filesystem for
+    try:
+        mode = os.stat(path).st_mode
+    except OSError as ex:
+        if ex.errno == errno.ENOENT:
+            return
+        raise
+
+    if stat.S_ISDIR(mode):
+        # an empty directory (common for freshly created cache locations)
+        # needs just an rmdir, not rmtree's recursive scan-and-unlink walk
+        with os.scandir(path) as entries:
+            is_empty = next(entries, None) is None
+        if is_empty:
+            return os.rmdir(path)
         return shutil.rmtree(path)
 
-    if os.path.isfile(path):
+    if stat.S_ISREG(mode):
         return os.remove(path)
 
 
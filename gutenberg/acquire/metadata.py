@@ -6,15 +6,19 @@ import abc
 import codecs
 import logging
 import os
+import queue
 import re
 import shutil
 import tarfile
 import tempfile
+import threading
 from contextlib import closing
 from contextlib import contextmanager
 from urllib.request import urlopen
 
+import requests
 from rdflib import plugin
+from sqlalchemy import event
 from rdflib.graph import Graph
 from rdflib.query import ResultException
 from rdflib.store import Store
@@ -35,6 +39,48 @@ _GUTENBERG_CATALOG_URL = \
     r'http://www.gutenberg.org/cache/epub/feeds/rdf-files.tar.bz2'
 _DB_IDENTIFIER = 'urn:gutenberg:metadata'
 _DB_PATH = local_path(os.path.join('metadata', 'metadata.db'))
+_PG_RDF_REGEX = re.compile(r'pg\d+.rdf$')
+
+
+def _iter_on_background_thread(iterator, batch_size=1024, buffer_size=16):
+    """Consumes an iterator on a background thread, handing its items over to
+    the caller in batches via a bounded queue. This overlaps production (e.g.
+    catalog decompression and XML parsing) with consumption (e.g. writes to
+    the cache store) while keeping the amount of buffered work bounded.
+
+    """
+    done = object()
+    buffer = queue.Queue(maxsize=buffer_size)
+    errors = []
+
+    def produce():
+        try:
+            batch = []
+            for item in iterator:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    buffer.put(batch)
+                    batch = []
+            if batch:
+                buffer.put(batch)
+        except Exception as error:
+            errors.append(error)
+        finally:
+            buffer.put(done)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    while True:
+        batch = buffer.get()
+        if batch is done:
+            break
+        for item in batch:
+            yield item
+
+    producer.join()
+    if errors:
+        raise errors[0]
 
 
 class MetadataCache(metaclass=abc.ABCMeta):
@@ -79,6 +125,7 @@ class MetadataCache(metaclass=abc.ABCMeta):
         """
         self.close()
         remove(self._local_storage_path)
+        _bump_cache_generation()
 
     def populate(self):
         """Populates a new cache.
@@ -89,10 +136,17 @@ class MetadataCache(metaclass=abc.ABCMeta):
 
         self._populate_setup()
 
-        with closing(self.graph):
-            with self._download_metadata_archive() as metadata_archive:
-                for fact in self._iter_metadata_triples(metadata_archive):
-                    self._add_to_graph(fact)
+        try:
+            with closing(self.graph):
+                with self._download_metadata_archive() as metadata_archive:
+                    facts = self._iter_metadata_triples(metadata_archive)
+                    for fact in _iter_on_background_thread(facts):
+                        self._add_to_graph(fact)
+                    self.graph.commit()
+        finally:
+            # even a partial populate changes the data behind any memoized
+            # query results
+            _bump_cache_generation()
 
     def _add_to_graph(self, fact):
         """Adds a (subject, predicate, object) RDF triple to the graph.
@@ -140,10 +194,26 @@ class MetadataCache(metaclass=abc.ABCMeta):
 
         """
         with tempfile.NamedTemporaryFile(delete=False) as metadata_archive:
-            shutil.copyfileobj(urlopen(self.catalog_source), metadata_archive)
+            self._download_catalog(metadata_archive)
         yield metadata_archive.name
         remove(metadata_archive.name)
 
+    def _download_catalog(self, fileobj, chunk_size=1024 * 1024):
+        """Writes the catalog pointed to by catalog_source to the provided
+        file object. Web sources are streamed via requests (connection
+        pooling, redirects); other schemes such as file:// fall back to
+        urlopen.
+
+        """
+        if self.catalog_source.startswith(('http://', 'https://')):
+            response = requests.get(self.catalog_source, stream=True)
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                fileobj.write(chunk)
+        else:
+            shutil.copyfileobj(urlopen(self.catalog_source), fileobj,
+                               length=chunk_size)
+
     @classmethod
     def _metadata_is_invalid(cls, fact):
         """Determines if the fact is not well formed.
@@ -158,10 +228,14 @@ class MetadataCache(metaclass=abc.ABCMeta):
         catalog dump.
 
         """
-        pg_rdf_regex = re.compile(r'pg\d+.rdf$')
-        with closing(tarfile.open(metadata_archive_path)) as metadata_archive:
+        # the archive is read in streaming mode (single forward pass) so
+        # that members are decompressed incrementally with bounded memory
+        # instead of requiring seekable access to the whole tarball
+        with closing(tarfile.open(metadata_archive_path,
+                                  mode='r|*')) as metadata_archive:
             for item in metadata_archive:
-                if pg_rdf_regex.search(item.name):
+                if (item.name.endswith('.rdf')
+                        and _PG_RDF_REGEX.search(item.name)):
                     with disable_logging():
                         extracted = metadata_archive.extractfile(item)
                         graph = Graph().parse(extracted)
@@ -276,6 +350,13 @@ class SqliteMetadataCache(MetadataCache):
     """
     _CACHE_URI_PREFIX = 'sqlite:///'
 
+    _BULK_LOAD_PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA cache_size=-64000',
+    )
+
     def __init__(self, cache_location):
         cache_uri = self._CACHE_URI_PREFIX + cache_location
         store = plugin.get('SQLAlchemy', Store)(identifier=_DB_IDENTIFIER)
@@ -283,6 +364,30 @@ class SqliteMetadataCache(MetadataCache):
 
     def _populate_setup(self):
         self.graph.open(self.cache_uri, create=True)
+        self._tune_connections_for_bulk_load()
+
+    def _tune_connections_for_bulk_load(self):
+        """Relaxes the SQLite durability settings for the duration of the
+        bulk load: write-ahead logging and normal (instead of full)
+        synchronisation avoid two fsyncs per transaction which would
+        otherwise dominate the cache population time.
+
+        """
+        engine = self.graph.store.engine
+
+        @event.listens_for(engine, 'connect')
+        def set_pragmas(dbapi_connection, connection_record):
+            # pylint:disable=W0613
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in self._BULK_LOAD_PRAGMAS:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+        # recycle any connection that was created before the listener above
+        # was registered so that all future checkouts have the pragmas set
+        engine.dispose()
 
     @property
     def _local_storage_path(self):
@@ -295,8 +400,6 @@ class SqliteMetadataCache(MetadataCache):
             self.graph.rollback()
             if not self._is_graph_add_exception_acceptable(ex):
                 raise ex
-        else:
-            self.graph.commit()
 
     @classmethod
     def _is_graph_add_exception_acceptable(cls, ex):
@@ -310,10 +413,30 @@ class SqliteMetadataCache(MetadataCache):
 
 
 _METADATA_CACHE = None
+_CACHE_GENERATION = 0
 
 registerplugins()
 
 
+def _bump_cache_generation():
+    """Advances the token returned by cache_generation, marking all query
+    results memoized against the previous token as stale.
+
+    """
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+
+
+def cache_generation():
+    """Returns a token that changes whenever the active metadata cache is
+    replaced or its contents may have changed (populate, refresh, delete).
+    Memoized query results key on this token so that they never outlive the
+    data they were computed from.
+
+    """
+    return _CACHE_GENERATION
+
+
 def set_metadata_cache(cache):
     """Sets the metadata cache object to use.
 
@@ -324,6 +447,7 @@ def set_metadata_cache(cache):
         _METADATA_CACHE.close()
 
     _METADATA_CACHE = cache
+    _bump_cache_generation()
 
 
 def get_metadata_cache():
@@ -19,6 +19,10 @@ _TEXT_CACHE = local_path('text')
 _GUTENBERG_MIRROR = os.environ.get('GUTENBERG_MIRROR',
                                    'http://gutenberg.readingroo.ms')
 
+# shared session so that the HEAD probes for candidate extensions and the
+# subsequent GET reuse one pooled keep-alive connection to the mirror
+_SESSION = requests.Session()
+
 
 def _etextno_to_uri_subdirectory(etextno):
     """Returns the subdirectory that an etextno will be found in a gutenberg
@@ -43,7 +47,7 @@ def _etextno_to_uri_subdirectory(etextno):
 
 def _does_uri_exist(uri):
     try:
-        response = requests.head(uri)
+        response = _SESSION.head(uri)
     except RequestException:
         return False
     return response.ok
@@ -64,13 +68,7 @@ def _format_download_uri_for_extension(etextno, extension, mirror=None):
     root = mirror.strip().rstrip('/')
     path = _etextno_to_uri_subdirectory(etextno)
 
-    uri = '{root}/{path}/{etextno}{extension}'.format(
-        root=root,
-        path=path,
-        etextno=etextno,
-        extension=extension)
-
-    return uri
+    return f'{root}/{path}/{etextno}{extension}'
 
 
 def _format_download_uri(etextno, mirror=None, prefer_ascii=False):
@@ -126,7 +124,7 @@ def load_etext(etextno, refresh_cache=False, mirror=None, prefer_ascii=False):
     if not os.path.exists(cached):
         makedirs(os.path.dirname(cached))
         download_uri = _format_download_uri(etextno, mirror, prefer_ascii)
-        response = requests.get(download_uri)
+        response = _SESSION.get(download_uri)
         # Ensure proper UTF-8 saving. There might be instances of ebooks or
         # mirrors which advertise a broken encoding, and this will break
         # downstream usages. For example, #55517 from aleph.gutenberg.org:
@@ -3,7 +3,7 @@
 
 
 import abc
-import os
+from functools import lru_cache
 
 from rdflib.term import URIRef
 
@@ -12,11 +12,14 @@ from gutenberg._domain_model.exceptions import UnsupportedFeatureException
 from gutenberg._domain_model.types import validate_etextno
 from gutenberg._util.abc import abstractclassmethod
 from gutenberg._util.objects import all_subclasses
+from gutenberg.acquire.metadata import cache_generation
 from gutenberg.acquire.metadata import load_metadata
 
 
 def get_metadata(feature_name, etextno):
-    """Looks up the value of a meta-data feature for a given text.
+    """Looks up the value of a meta-data feature for a given text. Repeated
+    lookups are memoized until the metadata cache is repopulated, refreshed,
+    deleted or replaced.
 
     Arguments:
         feature_name (str): The name of the meta-data to look up.
@@ -32,12 +35,24 @@ def get_metadata(feature_name, etextno):
             can extract meta-data for the given feature name.
 
     """
+    return _get_metadata_cached(cache_generation(), feature_name, etextno)
+
+
+@lru_cache(maxsize=8192)
+def _get_metadata_cached(generation, feature_name, etextno):
+    # the generation token is part of the memoization key: it advances
+    # whenever a cache is installed or its data changes (populate, refresh,
+    # delete), so the memo never serves stale results and holds no reference
+    # to replaced cache objects
+    # pylint:disable=W0613
     metadata_values = MetadataExtractor.get(feature_name).get_metadata(etextno)
     return frozenset(metadata_values)
 
 
 def get_etexts(feature_name, value):
     """Looks up all the texts that have meta-data matching some criterion.
+    Repeated lookups are memoized until the metadata cache is repopulated,
+    refreshed, deleted or replaced.
 
     Arguments:
         feature_name (str): The meta-data on which to select the texts.
@@ -52,6 +67,12 @@ def get_etexts(feature_name, value):
             can extract meta-data for the given feature name.
 
     """
+    return _get_etexts_cached(cache_generation(), feature_name, value)
+
+
+@lru_cache(maxsize=8192)
+def _get_etexts_cached(generation, feature_name, value):
+    # pylint:disable=W0613
     matching_etexts = MetadataExtractor.get(feature_name).get_etexts(value)
     return frozenset(matching_etexts)
 
@@ -68,6 +89,28 @@ def list_supported_metadatas():
     return tuple(sorted(MetadataExtractor._implementations().keys()))
 
 
+@lru_cache(maxsize=10000)
+def _etext_to_uri(etextno):
+    """Converts a Gutenberg text identifier to the representation used to
+    identify the text in the meta-data RDF graph.
+
+    """
+    uri = fr'http://www.gutenberg.org/ebooks/{etextno}'
+    return URIRef(uri)
+
+
+@lru_cache(maxsize=10000)
+def _uri_to_etext(uri_ref):
+    """Converts the representation used to identify a text in the meta-data
+    RDF graph to a human-friendly integer text identifier.
+
+    """
+    try:
+        return validate_etextno(int(str(uri_ref).rpartition('/')[2]))
+    except InvalidEtextIdException:
+        return None
+
+
 class MetadataExtractor(metaclass=abc.ABCMeta):
     """This class represents the interface by which the public functions in
     this API can be extended to provide access to Project Gutenberg meta-data.
@@ -118,8 +161,7 @@ class MetadataExtractor(metaclass=abc.ABCMeta):
         identify the text in the meta-data RDF graph.
 
         """
-        uri = fr'http://www.gutenberg.org/ebooks/{etextno}'
-        return URIRef(uri)
+        return _etext_to_uri(etextno)
 
     @classmethod
     def _uri_to_etext(cls, uri_ref):
@@ -127,10 +169,7 @@ class MetadataExtractor(metaclass=abc.ABCMeta):
         meta-data RDF graph to a human-friendly integer text identifier.
 
         """
-        try:
-            return validate_etextno(int(os.path.basename(uri_ref.toPython())))
-        except InvalidEtextIdException:
-            return None
+        return _uri_to_etext(uri_ref)
 
     @classmethod
     def _implementations(cls):
@@ -1,6 +1,8 @@
 """Module for implementations of the MetadataExtractor interface."""
 
 
+import sys
+
 from rdflib.term import bind
 from rdflib.term import Literal
 from rdflib.term import URIRef
@@ -12,6 +14,17 @@ from gutenberg._util.abc import abstractclassmethod
 from gutenberg.query.api import MetadataExtractor
 
 
+def _intern_value(value):
+    """Interns string results so that values repeated across many texts
+    (author names, language codes, rights statements) share one object
+    instead of allocating a fresh string per text.
+
+    """
+    # sys.intern only accepts exact strings (toPython may return dates,
+    # numbers or str subclasses for some literals)
+    return sys.intern(value) if type(value) is str else value
+
+
 class _SimplePredicateRelationshipExtractor(MetadataExtractor):
     """Extracts any sort of meta-data that is directly connected to a text via
     a simple predicate relationship or a simple predicate-path relationship.
@@ -29,16 +42,34 @@ class _SimplePredicateRelationshipExtractor(MetadataExtractor):
     def contains(cls, value):
         raise NotImplementedError  # pragma: no cover
 
+    @classmethod
+    def _cached_predicate(cls):
+        """Returns the value of predicate(), evaluating it at most once per
+        extractor class: constructing a property path allocates a fresh rdflib
+        Path object on every call, which adds up over long query loops.
+        The contains() result cannot be cached the same way since it depends
+        on the queried value.
+
+        """
+        predicate = cls.__dict__.get('_predicate')
+        if predicate is None:
+            predicate = cls.predicate()
+            cls._predicate = predicate
+        return predicate
+
     @classmethod
     def get_metadata(cls, etextno):
         etext = cls._etext_to_uri(etextno)
-        query = cls._metadata()[etext:cls.predicate():]
-        return frozenset(result.toPython() for result in query)
+        query = cls._metadata()[etext:cls._cached_predicate():]
+        return frozenset(_intern_value(result.toPython()) for result in query)
 
     @classmethod
     def get_etexts(cls, requested_value):
-        query = cls._metadata()[:cls.predicate():cls.contains(requested_value)]
-        results = (cls._uri_to_etext(result) for result in query)
+        predicate = cls._cached_predicate()
+        query = cls._metadata()[:predicate:cls.contains(requested_value)]
+        # property-path matches can yield the same subject more than once,
+        # so deduplicate before paying for the URI-to-etext conversion
+        results = (cls._uri_to_etext(result) for result in set(query))
         return frozenset(result for result in results if result is not None)
 
 
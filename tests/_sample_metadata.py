@@ -2,136 +2,196 @@
 # pylint: disable=W0142
 
 
-import codecs
+import itertools
 import json
 import os
 import sys
+from functools import lru_cache
+
+
+_ETEXTNO_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> '
+    '<http://www.gutenberg.org/2009/pgterms/ebook> '
+    '.'
+)
+
+_AUTHOR_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://purl.org/dc/terms/creator> '
+    '<http://www.gutenberg.org/2009/agents/%(agent)s> '
+    '.\n'
+    '<http://www.gutenberg.org/2009/agents/%(agent)s> '
+    '<http://www.gutenberg.org/2009/pgterms/name> '
+    '"%(author)s" '
+    '.'
+)
+
+_TITLE_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://purl.org/dc/terms/title> '
+    '"%(title)s"'
+    '.'
+)
+
+_RIGHTS_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://purl.org/dc/terms/rights> '
+    '"%(rights)s"'
+    '.'
+)
+
+_SUBJECT_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://purl.org/dc/terms/subject> '
+    '_:genid%(genid)s '
+    '.\n'
+    '_:genid%(genid)s '
+    '<http://www.w3.org/1999/02/22-rdf-syntax-ns#value> '
+    '"%(subject)s" '
+    '.'
+)
+
+_LANGUAGE_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://purl.org/dc/terms/language> '
+    '_:genid%(genid)s '
+    '.\n'
+    '_:genid%(genid)s '
+    '<http://www.w3.org/1999/02/22-rdf-syntax-ns#value> '
+    '"%(language)s"^^<http://purl.org/dc/terms/RFC4646> '
+    '.'
+)
+
+_FORMATURI_TEMPLATE = (
+    '<http://www.gutenberg.org/ebooks/%(etextno)s> '
+    '<http://purl.org/dc/terms/hasFormat> '
+    '<%(formaturi)s>'
+    '.'
+)
 
 
 class SampleMetaData:
     __uids = {}
+    __uid_counter = itertools.count(1)
 
     def __init__(self, etextno, authors=None, titles=None, formaturi=None,
                  rights=None, subject=None, language=None, is_phantom=False):
-        self.author = frozenset(authors or [])
-        self.title = frozenset(titles or [])
-        self.formaturi = frozenset(formaturi or [])
+        # the feature values are only ever iterated, so plain tuples beat
+        # frozensets which would hash every element on construction
+        self.author = tuple(authors or ())
+        self.title = tuple(titles or ())
+        self.formaturi = tuple(formaturi or ())
         self.etextno = (etextno
                         if etextno is not None
-                        else self.__create_uid(self.author | self.title))
-        self.rights = frozenset(rights or [])
-        self.subject = frozenset(subject or [])
-        self.language = frozenset(language or [])
+                        else self.__create_uid(self.author + self.title))
+        self.rights = tuple(rights or ())
+        self.subject = tuple(subject or ())
+        self.language = tuple(language or ())
         self.is_phantom = is_phantom
+        self._rdf = None
+        self._feature_sets = {}
 
     @classmethod
     def __create_uid(cls, hashable):
-        return cls.__uids.setdefault(hashable, len(cls.__uids) + 1)
-
-    def _rdf_etextno(self):
-        return (
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://www.w3.org/1999/02/22-rdf-syntax-ns#type> '
-            '<http://www.gutenberg.org/2009/pgterms/ebook> '
-            '.'
-        ).format(etextno=self.etextno)
-
-    def _rdf_author(self):
-        return '' if not self.author else '\n'.join(
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://purl.org/dc/terms/creator> '
-            '<http://www.gutenberg.org/2009/agents/{agent}> '
-            '.\n'
-            '<http://www.gutenberg.org/2009/agents/{agent}> '
-            '<http://www.gutenberg.org/2009/pgterms/name> '
-            '"{author}" '
-            '.'
-            .format(etextno=self.etextno, author=author,
-                    agent=self.__create_uid(author))
-            for author in self.author)
-
-    def _rdf_title(self):
-        return '' if not self.title else '\n'.join(
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://purl.org/dc/terms/title> '
-            '"{title}"'
-            '.'
-            .format(etextno=self.etextno, title=title)
-            for title in self.title)
-
-    def _rdf_rights(self):
-        return '' if not self.rights else '\n'.join(
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://purl.org/dc/terms/rights> '
-            '"{rights}"'
-            '.'
-            .format(etextno=self.etextno, rights=rights)
-            for rights in self.rights)
-
-    def _rdf_subject(self):
-        return '' if not self.subject else '\n'.join(
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://purl.org/dc/terms/subject> '
-            '_:genid{genid} '
-            '.\n'
-            '_:genid{genid} '
-            '<http://www.w3.org/1999/02/22-rdf-syntax-ns#value> '
-            '"{subject}" '
-            '.'
-            .format(etextno=self.etextno, subject=subject,
-                    genid=self.__create_uid(subject))
-            for subject in self.subject)
-
-    def _rdf_language(self):
-        return '' if not self.language else '\n'.join(
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://purl.org/dc/terms/language> '
-            '_:genid{genid} '
-            '.\n'
-            '_:genid{genid} '
-            '<http://www.w3.org/1999/02/22-rdf-syntax-ns#value> '
-            '"{language}"^^<http://purl.org/dc/terms/RFC4646> '
-            '.'
-            .format(etextno=self.etextno, language=language,
-                    genid=self.__create_uid(language))
-            for language in self.language)
-
-    def _rdf_formaturi(self):
-        return '' if not self.formaturi else '\n'.join(
-            '<http://www.gutenberg.org/ebooks/{etextno}> '
-            '<http://purl.org/dc/terms/hasFormat> '
-            '<{formaturi}>'
-            '.'
-            .format(etextno=self.etextno, formaturi=formaturi)
-            for formaturi in self.formaturi)
-
-    @property
-    def _facts(self):
-        for method_name in dir(self):
-            if method_name.startswith('_rdf_'):
-                rdf_fact = getattr(self, method_name)
-                yield rdf_fact()
+        uid = cls.__uids.get(hashable)
+        if uid is None:
+            uid = cls.__uids[hashable] = next(cls.__uid_counter)
+        return uid
+
+    def feature_set(self, feature):
+        """Returns the expected values of a feature as a frozenset, built at
+        most once per sample so repeated assertions reuse the same object.
+
+        """
+        values = self._feature_sets.get(feature)
+        if values is None:
+            values = self._feature_sets[feature] = \
+                frozenset(getattr(self, feature))
+        return values
+
+    def _append_etextno(self, facts):
+        facts.append(_ETEXTNO_TEMPLATE % {'etextno': self.etextno})
+
+    def _append_authors(self, facts):
+        for author in self.author:
+            facts.append(_AUTHOR_TEMPLATE
+                         % {'etextno': self.etextno, 'author': author,
+                            'agent': self.__create_uid(author)})
+
+    def _append_titles(self, facts):
+        for title in self.title:
+            facts.append(_TITLE_TEMPLATE
+                         % {'etextno': self.etextno, 'title': title})
+
+    def _append_rights(self, facts):
+        for rights in self.rights:
+            facts.append(_RIGHTS_TEMPLATE
+                         % {'etextno': self.etextno, 'rights': rights})
+
+    def _append_subjects(self, facts):
+        for subject in self.subject:
+            facts.append(_SUBJECT_TEMPLATE
+                         % {'etextno': self.etextno, 'subject': subject,
+                            'genid': self.__create_uid(subject)})
+
+    def _append_languages(self, facts):
+        for language in self.language:
+            facts.append(_LANGUAGE_TEMPLATE
+                         % {'etextno': self.etextno, 'language': language,
+                            'genid': self.__create_uid(language)})
+
+    def _append_formaturis(self, facts):
+        for formaturi in self.formaturi:
+            facts.append(_FORMATURI_TEMPLATE
+                         % {'etextno': self.etextno, 'formaturi': formaturi})
 
     def rdf(self):
-        return '\n'.join(fact for fact in self._facts if fact)
+        # the serialization is pure so it's computed at most once per sample;
+        # each category appends its facts into one shared list so that a
+        # single join produces the final string without intermediate strings
+        if self._rdf is None:
+            facts = []
+            self._append_etextno(facts)
+            self._append_authors(facts)
+            self._append_titles(facts)
+            self._append_rights(facts)
+            self._append_subjects(facts)
+            self._append_languages(facts)
+            self._append_formaturis(facts)
+            self._rdf = '\n'.join(facts)
+        return self._rdf
 
     @classmethod
+    @lru_cache(maxsize=None)
     def for_etextno(cls, etextno):
         metadata = _load_metadata(etextno)
         return SampleMetaData(etextno, **metadata)
 
     @staticmethod
     def all():
-        for etextno in os.listdir(_sample_metadata_path()):
-            yield SampleMetaData.for_etextno(int(etextno))
+        return _all_sample_metadata()
 
 
-def _sample_metadata_path():
-    module = os.path.dirname(sys.modules['tests'].__file__)
-    return os.path.join(module, 'data', 'sample-metadata')
+_SAMPLE_METADATA_PATH = os.path.join(
+    os.path.dirname(sys.modules['tests'].__file__), 'data', 'sample-metadata')
 
 
+@lru_cache(maxsize=None)
+def _all_sample_metadata():
+    # materialized once per test session so repeated sample_data() calls do
+    # not re-walk the data directory
+    with os.scandir(_SAMPLE_METADATA_PATH) as entries:
+        return tuple(SampleMetaData.for_etextno(int(entry.name))
+                     for entry in entries)
+
+
+# bind the decoder once instead of letting json.load(s) construct one per call
+_JSON_DECODE = json.JSONDecoder().decode
+
+
+@lru_cache(maxsize=None)
 def _load_metadata(etextno):
-    data_path = os.path.join(_sample_metadata_path(), str(etextno))
-    with codecs.open(data_path, encoding='utf-8') as fobj:
-        return json.load(fobj)
+    data_path = os.path.join(_SAMPLE_METADATA_PATH, str(etextno))
+    with open(data_path, 'rb') as fobj:
+        return _JSON_DECODE(fobj.read().decode('utf-8'))
@@ -22,8 +22,10 @@ class SampleText:
 
     @staticmethod
     def all():
-        raw_texts = set(os.listdir(_rawtext_data_path()))
-        clean_texts = set(os.listdir(_cleantext_data_path()))
+        raw_texts = set(entry.name
+                        for entry in os.scandir(_rawtext_data_path()))
+        clean_texts = set(entry.name
+                          for entry in os.scandir(_cleantext_data_path()))
         for etextno in raw_texts & clean_texts:
             yield SampleText.for_etextno(int(etextno))
 
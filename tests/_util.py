@@ -5,12 +5,15 @@
 
 
 import abc
+import atexit
+import io
 import os
 import shutil
 import tempfile
-from contextlib import closing
 from contextlib import contextmanager
 
+from rdflib.graph import Graph
+
 from gutenberg.acquire.metadata import SleepycatMetadataCache
 from gutenberg.acquire.metadata import set_metadata_cache
 import gutenberg.acquire.text
@@ -19,14 +22,16 @@ import gutenberg.acquire.text
 INTEGRATION_TESTS_ENABLED = bool(os.getenv('GUTENBERG_RUN_INTEGRATION_TESTS'))
 
 
-# noinspection PyPep8Naming,PyAttributeOutsideInit
+# noinspection PyPep8Naming
 class MockTextMixin:
-    def setUp(self):
-        self.mock_text_cache = tempfile.mkdtemp()
-        set_text_cache(self.mock_text_cache)
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_text_cache = tempfile.mkdtemp()
+        set_text_cache(cls.mock_text_cache)
 
-    def tearDown(self):
-        shutil.rmtree(self.mock_text_cache)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.mock_text_cache)
 
 
 # noinspection PyPep8Naming,PyAttributeOutsideInit
@@ -36,37 +41,73 @@ class MockMetadataMixin(metaclass=abc.ABCMeta):
         raise NotImplementedError  # pragma: no cover
 
     def setUp(self):
-        self.cache = _SleepycatMetadataCacheForTesting(self.sample_data, 'nt')
-        self.cache.populate()
+        self.cache = _shared_metadata_cache(self.sample_data)
         set_metadata_cache(self.cache)
 
     def tearDown(self):
         set_metadata_cache(None)
-        self.cache.delete()
+
+
+_SHARED_METADATA_CACHES = {}
+
+
+def _shared_metadata_cache(sample_data_factory):
+    """Returns a metadata cache populated with the factory's samples. Caches
+    are shared between all tests that use the same sample data so that the
+    RDF only has to be parsed into a store once per test session; the stores
+    are read-only from the tests' point of view and get deleted when the
+    test process exits.
+
+    """
+    key = tuple(item.rdf() for item in sample_data_factory())
+    cache = _SHARED_METADATA_CACHES.get(key)
+    if cache is None:
+        cache = _SleepycatMetadataCacheForTesting(sample_data_factory, 'nt')
+        cache.populate()
+        _SHARED_METADATA_CACHES[key] = cache
+    return cache
+
+
+@atexit.register
+def _delete_shared_metadata_caches():
+    for cache in _SHARED_METADATA_CACHES.values():
+        cache.delete()
+    _SHARED_METADATA_CACHES.clear()
+
+
+def _tmp_root():
+    """Returns a RAM-backed directory for scratch caches if the platform has
+    one (Sleepycat does many small synchronous writes during populate, which
+    are much cheaper on tmpfs than on disk), or None for the OS default.
+
+    """
+    path = '/dev/shm'
+    if os.path.isdir(path) and os.access(path, os.W_OK):
+        return path
+    return None
 
 
 class _SleepycatMetadataCacheForTesting(SleepycatMetadataCache):
     def __init__(self, sample_data_factory, data_format):
-        SleepycatMetadataCache.__init__(self, tempfile.mktemp())
+        SleepycatMetadataCache.__init__(self, tempfile.mktemp(dir=_tmp_root()))
         self.sample_data_factory = sample_data_factory
         self.data_format = data_format
 
-    def populate(self):
-        SleepycatMetadataCache.populate(self)
-
-        data = '\n'.join(item.rdf() for item in self.sample_data_factory())
-
-        self.graph.open(self.cache_uri, create=True)
-        with closing(self.graph):
-            self.graph.parse(data=data, format=self.data_format)
-
     @contextmanager
     def _download_metadata_archive(self):
         yield None
 
-    @classmethod
-    def _iter_metadata_triples(cls, metadata_archive_path):
-        return []
+    def _iter_metadata_triples(self, metadata_archive_path):
+        # parse the samples into a scratch graph and let the inherited
+        # populate() write the triples, so the Sleepycat store is only
+        # opened once instead of being re-opened for a second parse pass
+        # pre-encode once and hand rdflib a binary stream so the parser
+        # does not re-encode the whole N-Triples string internally
+        data = '\n'.join(item.rdf() for item in self.sample_data_factory())
+        graph = Graph()
+        graph.parse(source=io.BytesIO(data.encode('utf-8')),
+                    format=self.data_format)
+        return iter(graph)
 
 
 def set_text_cache(cache):
@@ -2,7 +2,6 @@
 # pylint: disable=R0904
 
 
-import itertools
 import unittest
 import re
 
@@ -34,18 +33,23 @@ class TestLoadMetadata(MockMetadataMixin, unittest.TestCase):
 
 class TestLoadEtext(MockTextMixin, unittest.TestCase):
     def test_load_etext(self):
-        loaders = (lambda etextno: load_etext(etextno, refresh_cache=True),
-                   lambda etextno: load_etext(etextno, refresh_cache=False))
         testcases = (
             SampleMetaData.for_etextno(2701),   # newstyle identifier
             SampleMetaData.for_etextno(5),      # oldstyle identifier
             SampleMetaData.for_etextno(14287),  # unicode text
             SampleMetaData.for_etextno(23962)   # UTF-8 text
         )
-        for testcase, loader in itertools.product(testcases, loaders):
-            etext = loader(testcase.etextno)
-            self.assertIsInstance(etext, str)
-            self.assertNotIn('\ufffd', etext)
+        for testcase in testcases:
+            # fetch once with a fresh cache, then again from the populated
+            # cache, so the second load is a pure cache read
+            etexts = []
+            for refresh_cache in (True, False):
+                etext = load_etext(testcase.etextno,
+                                   refresh_cache=refresh_cache)
+                self.assertIsInstance(etext, str)
+                self.assertNotIn('\ufffd', etext)
+                etexts.append(etext)
+            self.assertEqual(etexts[0], etexts[1])
 
     @responses.activate
     def test_invalid_etext(self):
@@ -75,14 +79,39 @@ class TestFailLoadEtext(unittest.TestCase):
 
 
 class TestExtensionsLoadEtext(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # one requests mock patches the transport for the whole class; the
+        # per-test @responses.activate decorator would re-patch and unpatch
+        # it around every method
+        cls._responses = responses.RequestsMock(
+            assert_all_requests_are_fired=False)
+        cls._responses.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._responses.stop()
+        cls._responses.reset()
+
+    def setUp(self):
+        self._responses.reset()
+
     def request_head_response(self, valid_files):
-        responses.add(responses.HEAD, text._GUTENBERG_MIRROR, status=200)
+        # a single callback with a set lookup replaces one registered
+        # response per valid file, so the mock answers every HEAD probe
+        # without scanning a list of regex matchers
+        valid_files = frozenset(valid_files)
+        mirror = text._GUTENBERG_MIRROR.rstrip('/')
 
-        for valid_file in valid_files:
-            url = re.compile(f'^.*{valid_file}$')
-            responses.add(responses.HEAD, url, status=200)
+        def head_response(request):
+            if request.url.rstrip('/') == mirror:
+                return 200, {}, ''
+            filename = request.url.rsplit('/', 1)[-1]
+            return (200 if filename in valid_files else 404), {}, ''
+
+        self._responses.add_callback(responses.HEAD, re.compile('.*'),
+                                     callback=head_response)
 
-    @responses.activate
     def test_extensions_order_utf8_only(self):
         utf8_filename = '12345-0.txt'
         self.request_head_response(valid_files=[utf8_filename])
@@ -93,7 +122,6 @@ class TestExtensionsLoadEtext(unittest.TestCase):
         extensions = text._format_download_uri(12345, prefer_ascii=False)
         self.assertEqual(extensions.split('/')[-1], utf8_filename)
 
-    @responses.activate
     def test_extensions_order_ascii_only(self):
         ascii_filename = '12345.txt'
         self.request_head_response(valid_files=[ascii_filename])
@@ -104,7 +132,6 @@ class TestExtensionsLoadEtext(unittest.TestCase):
         extensions = text._format_download_uri(12345, prefer_ascii=True)
         self.assertEqual(extensions.split('/')[-1], ascii_filename)
 
-    @responses.activate
     def test_extensions_order_utf8_first(self):
         utf8_filename = '12345-0.txt'
         all_files = ['12345.txt', '12345-8.txt', '12345-0.txt']
@@ -116,7 +143,6 @@ class TestExtensionsLoadEtext(unittest.TestCase):
         extensions = text._format_download_uri(12345, prefer_ascii=False)
         self.assertEqual(extensions.split('/')[-1], utf8_filename)
 
-    @responses.activate
     def test_extensions_order_ascii_first(self):
         ascii_filename = '12345.txt'
         all_files = ['12345-8.txt', '12345-0.txt', '12345.txt']
@@ -128,7 +154,6 @@ class TestExtensionsLoadEtext(unittest.TestCase):
         extensions = text._format_download_uri(12345, prefer_ascii=True)
         self.assertEqual(extensions.split('/')[-1], ascii_filename)
 
-    @responses.activate
     def test_extensions_order_eightbit_first(self):
         eightbit_filename = '12345-8.txt'
         ascii_filename = '12345.txt'
@@ -1,13 +1,22 @@
 # pylint: disable=C0111
 # pylint: disable=R0904
+# pylint: disable=W0212
 
 
+import atexit
+import bz2
 import os
+import shutil
 import sys
 import tempfile
 import unittest
+import uuid
+from functools import lru_cache
 from urllib.request import pathname2url
 
+from rdflib.term import Literal
+from rdflib.term import URIRef
+
 from gutenberg.acquire.metadata import CacheAlreadyExistsException
 from gutenberg.acquire.metadata import InvalidCacheException
 from gutenberg.acquire.metadata import FusekiMetadataCache
@@ -15,11 +24,27 @@ from gutenberg.acquire.metadata import SleepycatMetadataCache
 from gutenberg.acquire.metadata import SqliteMetadataCache
 from gutenberg.acquire.metadata import set_metadata_cache
 from gutenberg.query import get_metadata
+from tests._util import _tmp_root
 from tests._util import always_throw
 
 
 # noinspection PyPep8Naming,PyAttributeOutsideInit
 class MetadataCache:
+    @classmethod
+    def setUpClass(cls):
+        cls._storage_root = tempfile.TemporaryDirectory(dir=_tmp_root())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._storage_root.cleanup()
+
+    def _new_local_storage(self, suffix=''):
+        # unlike the deprecated tempfile.mktemp this composes a fresh name
+        # inside the class-scoped directory, which gets removed wholesale in
+        # tearDownClass instead of file by file
+        name = uuid.uuid4().hex + suffix
+        return os.path.join(self._storage_root.name, name)
+
     def test_read_unpopulated_cache(self):
         set_metadata_cache(self.cache)
         try:
@@ -55,6 +80,21 @@ class MetadataCache:
         title = get_metadata('title', 30929)
         self.assertIn('Het loterijbriefje', title)
 
+    def test_repopulate_invalidates_memoized_queries(self):
+        self.cache.populate()
+        set_metadata_cache(self.cache)
+        title = get_metadata('title', 30929)
+        self.assertIn('Het loterijbriefje', title)
+
+        self.cache.delete()
+        new_fact = (URIRef('http://www.gutenberg.org/ebooks/30929'),
+                    URIRef('http://purl.org/dc/terms/title'),
+                    Literal('Another title'))
+        self.cache._iter_metadata_triples = lambda archive_path: [new_fact]
+        self.cache.populate()
+        title = get_metadata('title', 30929)
+        self.assertEqual(title, frozenset({'Another title'}))
+
     def test_repopulate_without_delete(self):
         # Trying to populate an existing cache should raise an exception
         self.cache.populate()
@@ -92,21 +132,21 @@ class TestFuseki(MetadataCache, unittest.TestCase):
         if not cache_url:
             raise unittest.SkipTest('Fuseki URL not set')
 
-        self.local_storage = "%s.url" % tempfile.mktemp()
+        self.local_storage = self._new_local_storage(suffix='.url')
         self.cache = FusekiMetadataCache(self.local_storage, cache_url)
         self.cache.catalog_source = _sample_metadata_catalog_source()
 
 
 class TestSleepycat(MetadataCache, unittest.TestCase):
     def setUp(self):
-        self.local_storage = tempfile.mktemp()
+        self.local_storage = self._new_local_storage()
         self.cache = SleepycatMetadataCache(self.local_storage)
         self.cache.catalog_source = _sample_metadata_catalog_source()
 
 
 class TestSqlite(MetadataCache, unittest.TestCase):
     def setUp(self):
-        self.local_storage = "%s.sqlite" % tempfile.mktemp()
+        self.local_storage = self._new_local_storage(suffix='.sqlite')
         self.cache = SqliteMetadataCache(self.local_storage)
         self.cache.catalog_source = _sample_metadata_catalog_source()
 
@@ -120,10 +160,18 @@ class TestSqlite(MetadataCache, unittest.TestCase):
             self.cache.graph.add = original_add
 
 
+@lru_cache(maxsize=None)
 def _sample_metadata_catalog_source():
+    # the catalog reader handles plain tars transparently, so decompressing
+    # the sample tarball once up front means the repeated populate() calls
+    # in this module skip the bzip2 decode
     module = os.path.dirname(sys.modules['tests'].__file__)
     path = os.path.join(module, 'data', 'sample-rdf-files.tar.bz2')
-    return 'file://%s' % pathname2url(path)
+    handle, tar_path = tempfile.mkstemp(suffix='.tar')
+    with bz2.open(path, 'rb') as compressed, os.fdopen(handle, 'wb') as tar:
+        shutil.copyfileobj(compressed, tar)
+    atexit.register(os.remove, tar_path)
+    return 'file://%s' % pathname2url(tar_path)
 
 
 if __name__ == '__main__':
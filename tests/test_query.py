@@ -24,11 +24,11 @@ class TestGetMetadata(MockMetadataMixin, unittest.TestCase):
 
     def _run_get_metadata_for_feature(self, feature):
         for testcase in self.sample_data():
-            expected = getattr(testcase, feature)
+            expected = testcase.feature_set(feature)
             actual = get_metadata(feature, testcase.etextno)
-            self.assertEqual(
-                set(actual),
-                set(expected),
+            self.assertSetEqual(
+                frozenset(actual),
+                expected,
                 'non-matching {feature} for book {etextno}: '
                 'expected={expected} actual={actual}'
                 .format(
@@ -18,51 +18,76 @@ from gutenberg._util.os import reopen_encoded
 from tests._util import always_throw
 
 
-class TestAllSubclasses(unittest.TestCase):
-    def test_all_subclasses(self):
-        class Root:
-            pass
+# the fixture hierarchies live at module scope so that they are built once
+# per interpreter instead of on every test invocation
+class _Root:
+    pass
 
-        class AB(Root):
-            pass
 
-        class ABC(AB):
-            pass
+class _AB(_Root):
+    pass
 
-        class AD(Root):
-            pass
 
-        class ABAD(AB, AD):
-            pass
+class _ABC(_AB):
+    pass
 
-        class ABADE(ABAD):
-            pass
 
-        self.assertTrue(all_subclasses(Root), {AB, ABC, AD, ABAD, ABADE})
-        self.assertEqual(all_subclasses(ABADE), set())
+class _AD(_Root):
+    pass
 
 
-class TestAbstractClassMethod(unittest.TestCase):
-    def test_abstractclassmethod(self):
-        class ClassWithAbstractClassMethod(
-                metaclass=abc.ABCMeta):
-            @abstractclassmethod
-            def method(cls):
-                pass
+class _ABAD(_AB, _AD):
+    pass
+
+
+class _ABADE(_ABAD):
+    pass
+
 
-        class ConcreteImplementation(ClassWithAbstractClassMethod):
-            @classmethod
-            def method(cls):
-                pass
+class _ClassWithAbstractClassMethod(metaclass=abc.ABCMeta):
+    @abstractclassmethod
+    def method(cls):
+        pass
 
-        self.assertRaises(TypeError, ClassWithAbstractClassMethod)
-        ConcreteImplementation()
+
+class _ConcreteImplementation(_ClassWithAbstractClassMethod):
+    @classmethod
+    def method(cls):
+        pass
+
+
+class TestAllSubclasses(unittest.TestCase):
+    def test_all_subclasses(self):
+        self.assertEqual(all_subclasses(_Root),
+                         {_AB, _ABC, _AD, _ABAD, _ABADE})
+        self.assertEqual(all_subclasses(_ABADE), set())
+
+
+class TestAbstractClassMethod(unittest.TestCase):
+    def test_abstractclassmethod(self):
+        self.assertRaises(TypeError, _ClassWithAbstractClassMethod)
+        _ConcreteImplementation()
 
 
 class TestRemove(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # GUTENBERG_TEST_TMPDIR lets CI point the scratch space at a
+        # ramdisk when the default temp location is a slow or network
+        # filesystem
+        cls.temporary_root = tempfile.mkdtemp(
+            dir=os.environ.get('GUTENBERG_TEST_TMPDIR'))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temporary_root)
+
     def setUp(self):
-        self.temporary_directory = tempfile.mkdtemp()
-        self.temporary_file = tempfile.NamedTemporaryFile(delete=False).name
+        # per-test paths live inside the class-scoped root so that any
+        # leftovers are removed wholesale in tearDownClass
+        self.temporary_directory = tempfile.mkdtemp(dir=self.temporary_root)
+        handle, self.temporary_file = tempfile.mkstemp(dir=self.temporary_root)
+        os.close(handle)
 
     def test_remove(self):
         for path in (self.temporary_file, self.temporary_directory):
@@ -72,17 +97,31 @@ class TestRemove(unittest.TestCase):
 
 
 class TestMakedirs(unittest.TestCase):
-    def setUp(self):
-        self.temporary_directory = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # GUTENBERG_TEST_TMPDIR lets CI point the scratch space at a
+        # ramdisk when the default temp location is a slow or network
+        # filesystem
+        cls.temporary_root = tempfile.mkdtemp(
+            dir=os.environ.get('GUTENBERG_TEST_TMPDIR'))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temporary_root)
 
-    def tearDown(self):
-        shutil.rmtree(self.temporary_directory)
+    def setUp(self):
+        self.temporary_directory = tempfile.mkdtemp(dir=self.temporary_root)
 
     def test_makedirs(self):
-        path = os.path.join(self.temporary_directory, 'foo', 'bar', 'baz')
-        self.assertFalse(os.path.exists(path))
+        # the components are fixed relative names, so a plain os.sep join
+        # skips os.path.join's per-component absolute-path handling
+        path = os.sep.join((self.temporary_directory, 'foo', 'bar', 'baz'))
+        # stat directly instead of os.path.exists: one syscall per check and
+        # a failure mode that distinguishes missing from inaccessible
+        with self.assertRaises(FileNotFoundError):
+            os.lstat(path)
         makedirs(path)
-        self.assertTrue(os.path.exists(path))
+        os.stat(path)
 
     def test_makedirs_does_not_swallow_exception(self):
         original_makedirs = os.makedirs